@@ -3,18 +3,86 @@
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
 from datetime import datetime, timedelta
 import json
 import time
-import schedule
+import sched
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import os
+from itertools import groupby
 import sqlite3
 from dataclasses import dataclass, asdict
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional, Tuple
+import codecs
 
-@dataclass
+try:
+    import ahocorasick
+except ImportError:
+    # Optional: ohne pyahocorasick wird jeder Begriff per Substring-Suche geprueft
+    ahocorasick = None
+
+# Vorkompilierte XPath-Ausdruecke fuer das Scraping; libxml2 filtert in C.
+# class-Vergleiche case-insensitive ueber translate()
+_KLASSE = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+_NEWS_XPATH = etree.XPath(
+    "(//*[self::article or self::div][" +
+    ' or '.join(f"contains({_KLASSE}, '{wort}')" for wort in ('news', 'article', 'post', 'aktuell')) +
+    "])[position() <= 10]"
+)
+_TITEL_XPATH = etree.XPath("(.//*[self::h1 or self::h2 or self::h3 or self::h4 or self::a])[1]")
+_LINK_XPATH = etree.XPath("(.//a[@href])[1]")
+_TEXT_XPATH = etree.XPath(
+    "(.//*[self::p or self::div][" +
+    ' or '.join(f"contains({_KLASSE}, '{wort}')" for wort in ('text', 'beschreibung', 'summary', 'excerpt')) +
+    "])[1]"
+)
+_TEXTKNOTEN_XPATH = etree.XPath(".//text()[not(parent::script or parent::style)]")
+
+# Obergrenze fuer die Groesse eines RSS-Feeds (schuetzt vor Speicherspitzen)
+_MAX_FEED_BYTES = 8 * 1024 * 1024
+
+# Trigramm-Tokenizer fuer den Volltextindex (suche_thema) erst ab SQLite 3.34
+_FTS_TRIGRAMM = sqlite3.sqlite_version_info >= (3, 34, 0)
+
+# So viele Bytes einer Seite werden vor dem Parsen auf BOM/<meta charset> geprueft
+_HTML_KOPF_BYTES = 4096
+
+# Nur so viel der Zusammenfassung wird nach Schlagworten durchsucht; haelt den Aufwand
+# pro Artikel konstant, auch wenn ein Feed ganze Artikeltexte in <description> packt
+_MAX_SCAN_ZEICHEN = 500
+
+def _text(element) -> str:
+    """Textinhalt eines Elements, jedes Textstueck getrimmt (wie get_text(strip=True))"""
+    return ''.join(teil.strip() for teil in _TEXTKNOTEN_XPATH(element))
+
+def _html_kodierung(headers, anfang: bytes) -> Optional[str]:
+    """Zeichensatz fuer den HTML-Parser (None: libxml2 erkennt ihn selbst aus BOM/<meta>)"""
+    # Nur ein explizites charset= zaehlt; response.encoding faellt bei text/* auf
+    # ISO-8859-1 zurueck und wuerde UTF-8-Umlaute verfaelschen
+    if 'charset=' in headers.get('Content-Type', '').lower():
+        kodierung = requests.utils.get_encoding_from_headers(headers)
+        try:
+            codecs.lookup(kodierung)
+            return kodierung
+        except LookupError:
+            pass
+    if anfang.startswith((codecs.BOM_UTF8, codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)) or b'charset' in anfang.lower():
+        return None
+    # Ohne Angabe: UTF-8, ausser der Seitenanfang ist kein gueltiges UTF-8 (wie UnicodeDammit)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(anfang)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+# slots: kein __dict__ pro Instanz, deutlich weniger Speicher bei vielen Nachrichten
+@dataclass(slots=True, frozen=True)
 class BildungsNews:
     titel: str
     quelle: str
@@ -24,11 +92,60 @@ class BildungsNews:
     zusammenfassung: str
     schlagworte: List[str]
 
+def _eintrag_datum(entry, heute: str) -> str:
+    """ISO-Datum eines Feed-Eintrags (published, sonst updated, sonst heute)"""
+    # Direkt aus dem struct_time formatieren, ohne strftime/Locale-Umweg
+    t = entry.get('published_parsed') or entry.get('updated_parsed')
+    if t:
+        return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+    return heute
+
+def parse_feed(feed_url: str, daten: bytes, kopfzeilen: Dict[str, str], heute: str) -> List[Dict]:
+    """Parst die Rohdaten eines Feeds (laeuft im Prozess-Pool, daher nur einfache Rueckgabewerte)"""
+    # Mit den Antwort-Headern loest feedparser relative Links gegen die Feed-URL auf
+    # und beruecksichtigt den charset aus dem Content-Type
+    feed = feedparser.parse(daten, response_headers=kopfzeilen)
+    quelle = feed.feed.get('title', feed_url)
+    eintraege = []
+    
+    # Zusammenfassung schon hier kuerzen: weniger Daten zurueck durch die Prozessgrenze
+    for entry in feed.entries[:10]:
+        eintraege.append({
+            'titel': entry.get('title', ''),
+            'zusammenfassung': entry.get('summary', entry.get('description', ''))[:_MAX_SCAN_ZEICHEN],
+            'url': entry.get('link', ''),
+            'datum': _eintrag_datum(entry, heute),
+            'quelle': quelle
+        })
+    
+    return eintraege
+
+def _prozess_pool(anzahl_feeds: int) -> ProcessPoolExecutor:
+    """Prozess-Pool fuer parse_feed, hoechstens ein Prozess pro Feed"""
+    # Nicht fork: die Worker entstehen erst beim ersten submit, waehrend schon
+    # Download-Threads laufen; ein fork mit aktiven Threads kann haengen bleiben
+    methode = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=max(1, min(anzahl_feeds, os.cpu_count() or 1)),
+        mp_context=multiprocessing.get_context(methode)
+    )
+
 class BildungsMonitor:
     def __init__(self, db_path="bildung_monitor.db"):
         self.db_path = db_path
+        # Eine Verbindung fuer die gesamte Laufzeit; Transaktionen werden explizit
+        # mit BEGIN/COMMIT gesteuert (isolation_level=None)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
         self.init_database()
         
+        # Wiederkehrende Strings (Quelle, Datum) nur einmal im Speicher halten;
+        # aus dem Prozess-Pool kommt sonst fuer jeden Eintrag eine eigene Kopie
+        self._intern = {}
+        
+        # ETag/Last-Modified abgerufener Feeds; wird erst zusammen mit den
+        # Nachrichten in speichere_news festgeschrieben
+        self._offene_feed_status = {}
+        
         # Wichtige Bildungsthemen-Kategorien
         self.kategorien = {
             'digitalisierung': ['digitalisierung', 'digital', 'edtech', 'lernplattform', 'e-learning', 'online-lernen'],
@@ -85,10 +202,42 @@ class BildungsMonitor:
             'https://www.deae.de/startseite/',
         ]
         
+        # Gemeinsame HTTP-Session: Verbindungen (inkl. TLS) werden wiederverwendet
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Alle Begriffe mit (Rang, Kategorie, Begriff); der Rang haelt die Definitionsreihenfolge fest
+        self._begriffe = {}
+        for kategorie, begriffe in self.kategorien.items():
+            for begriff in begriffe:
+                self._begriffe[begriff] = (len(self._begriffe), kategorie, begriff)
+        
+        if ahocorasick is not None:
+            # Aho-Corasick-Automat ueber alle Begriffe: ein Durchlauf pro Text
+            # statt einer Substring-Suche pro Begriff
+            self._automat = ahocorasick.Automaton()
+            for begriff, wert in self._begriffe.items():
+                self._automat.add_word(begriff, wert)
+            self._automat.make_automaton()
+        else:
+            # Fallback ohne C-Erweiterung: vorberechnetes Tupel fuer eine einzige
+            # Set-Comprehension. Die Substring-Suche von str ist hier schneller als
+            # eine Regex-Alternation oder ein Hash-Filter ueber N-Gramme
+            self._automat = None
+            self._begriffsliste = tuple(self._begriffe.items())
+        
     def init_database(self):
         """Initialisiert die SQLite-Datenbank"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self._conn.cursor()
+        # WAL-Modus: weniger fsyncs beim Schreiben, Leser blockieren nicht
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        # 64 MiB Page-Cache und temporaere Tabellen im Speicher (gilt pro Verbindung)
+        c.execute("PRAGMA cache_size=-65536")
+        c.execute("PRAGMA temp_store=MEMORY")
+        
         c.execute('''
             CREATE TABLE IF NOT EXISTS nachrichten (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -102,83 +251,254 @@ class BildungsMonitor:
                 erstellt_am TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         ''')
-        conn.commit()
-        conn.close()
+        
+        # Indizes fuer Bericht (datum >= ? GROUP BY kategorie) und Kategorie-Abfragen
+        c.execute("CREATE INDEX IF NOT EXISTS idx_nachrichten_datum_kat ON nachrichten(datum, kategorie)")
+        c.execute("CREATE INDEX IF NOT EXISTS idx_nachrichten_kat_datum ON nachrichten(kategorie, datum)")
+        
+        # Volltextindex fuer suche_thema; Trigramme erlauben Teilwortsuche wie LIKE '%x%'
+        # (tokenize='trigram' gibt es erst ab SQLite 3.34; aeltere Versionen suchen per LIKE)
+        if _FTS_TRIGRAMM:
+            c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'nachrichten_fts'")
+            fts_neu = c.fetchone() is None
+            c.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS nachrichten_fts USING fts5(
+                    titel, zusammenfassung,
+                    content='nachrichten', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            c.execute('''
+                CREATE TRIGGER IF NOT EXISTS nachrichten_fts_ai AFTER INSERT ON nachrichten BEGIN
+                    INSERT INTO nachrichten_fts(rowid, titel, zusammenfassung)
+                    VALUES (new.id, new.titel, new.zusammenfassung);
+                END
+            ''')
+            c.execute('''
+                CREATE TRIGGER IF NOT EXISTS nachrichten_fts_ad AFTER DELETE ON nachrichten BEGIN
+                    INSERT INTO nachrichten_fts(nachrichten_fts, rowid, titel, zusammenfassung)
+                    VALUES ('delete', old.id, old.titel, old.zusammenfassung);
+                END
+            ''')
+            c.execute('''
+                CREATE TRIGGER IF NOT EXISTS nachrichten_fts_au AFTER UPDATE ON nachrichten BEGIN
+                    INSERT INTO nachrichten_fts(nachrichten_fts, rowid, titel, zusammenfassung)
+                    VALUES ('delete', old.id, old.titel, old.zusammenfassung);
+                    INSERT INTO nachrichten_fts(rowid, titel, zusammenfassung)
+                    VALUES (new.id, new.titel, new.zusammenfassung);
+                END
+            ''')
+            if fts_neu:
+                # Bestehende Datenbank: Index einmalig aus vorhandenen Nachrichten aufbauen
+                c.execute("INSERT INTO nachrichten_fts(nachrichten_fts) VALUES ('rebuild')")
+        
+        # Schlagworte normalisiert, damit Abfragen nach einem Begriff den Index nutzen
+        # statt jede Zeile zu scannen und das JSON zu parsen
+        c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schlagwort'")
+        schlagwort_neu = c.fetchone() is None
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS schlagwort (
+                news_id INTEGER REFERENCES nachrichten(id),
+                begriff TEXT,
+                PRIMARY KEY (news_id, begriff)
+            )
+        ''')
+        c.execute("CREATE INDEX IF NOT EXISTS idx_schlagwort_begriff ON schlagwort(begriff)")
+        # Befuellung per Trigger: greift nur fuer tatsaechlich eingefuegte Nachrichten,
+        # innerhalb derselben Transaktion wie das INSERT
+        c.execute('''
+            CREATE TRIGGER IF NOT EXISTS nachrichten_schlagwort_ai AFTER INSERT ON nachrichten BEGIN
+                INSERT OR IGNORE INTO schlagwort(news_id, begriff)
+                SELECT new.id, value FROM json_each(new.schlagworte);
+            END
+        ''')
+        c.execute('''
+            CREATE TRIGGER IF NOT EXISTS nachrichten_schlagwort_ad AFTER DELETE ON nachrichten BEGIN
+                DELETE FROM schlagwort WHERE news_id = old.id;
+            END
+        ''')
+        if schlagwort_neu:
+            # Bestehende Datenbank: Tabelle einmalig aus den JSON-Spalten befuellen
+            c.execute('''
+                INSERT OR IGNORE INTO schlagwort(news_id, begriff)
+                SELECT n.id, j.value
+                FROM nachrichten n, json_each(n.schlagworte) j
+                WHERE json_valid(n.schlagworte)
+            ''')
+        
+        # HTTP-Validatoren je Feed fuer bedingte Abrufe (304 Not Modified)
+        c.execute('''
+            CREATE TABLE IF NOT EXISTS feed_status (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                letzter_abruf TIMESTAMP
+            )
+        ''')
     
-    def kategorisiere(self, text: str) -> str:
-        """Kategorisiert einen Text basierend auf Schlagworten"""
+    def _scan(self, text: str):
+        """Sucht alle Begriffe in einem Durchlauf (Scores je Kategorie, Treffer)"""
         text_lower = text.lower()
+        if self._automat is not None:
+            gefunden = {wert for _, wert in self._automat.iter(text_lower)}
+        else:
+            gefunden = {wert for begriff, wert in self._begriffsliste if begriff in text_lower}
         scores = defaultdict(int)
+        treffer = set()
         
-        for kategorie, begriffe in self.kategorien.items():
-            for begriff in begriffe:
-                if begriff in text_lower:
-                    scores[kategorie] += 1
+        # Nach Rang sortiert, damit bei Gleichstand wie bisher die zuerst
+        # definierte Kategorie gewinnt
+        for _, kategorie, begriff in sorted(gefunden):
+            scores[kategorie] += 1
+            treffer.add(begriff)
         
-        if scores:
-            return max(scores, key=scores.get)
-        return 'allgemein'
+        return scores, treffer
+    
+    def analysiere(self, text: str) -> Tuple[str, List[str]]:
+        """Ermittelt Kategorie und Schlagworte mit einem einzigen Scan"""
+        scores, treffer = self._scan(text)
+        
+        kategorie = max(scores, key=scores.get) if scores else 'allgemein'
+        return kategorie, list(treffer)[:5]
+    
+    def kategorisiere(self, text: str) -> str:
+        """Kategorisiert einen Text basierend auf Schlagworten"""
+        return self.analysiere(text)[0]
     
     def extrahiere_schlagworte(self, text: str) -> List[str]:
         """Extrahiert relevante Schlagworte aus dem Text"""
-        schlagworte = set()
-        text_lower = text.lower()
-        
-        for kategorie_begriffe in self.kategorien.values():
-            for begriff in kategorie_begriffe:
-                if begriff in text_lower:
-                    schlagworte.add(begriff)
+        return self.analysiere(text)[1]
+    
+    def _lade_feed(self, feed_url: str, etag: Optional[str] = None,
+                   last_modified: Optional[str] = None) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Laedt einen Feed gestreamt und mit Groessenbegrenzung herunter"""
+        # Bedingter Abruf: unveraenderte Feeds werden weder uebertragen noch geparst.
+        # Rueckgabe (Daten, Antwort-Header); Daten sind None bei 304 Not Modified
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        
+        # Selbst herunterladen, damit der Timeout greift (feedparser hat keinen)
+        with self.session.get(feed_url, headers=headers, timeout=10, stream=True) as response:
+            if response.status_code == 304:
+                return None, {}
+            response.raise_for_status()
+            
+            laenge = response.headers.get('Content-Length')
+            if laenge and laenge.isdigit() and int(laenge) > _MAX_FEED_BYTES:
+                raise ValueError(f"Feed zu gross ({laenge} Bytes)")
+            
+            chunks = []
+            gelesen = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                gelesen += len(chunk)
+                if gelesen > _MAX_FEED_BYTES:
+                    raise ValueError(f"Feed zu gross (mehr als {_MAX_FEED_BYTES} Bytes)")
+                chunks.append(chunk)
+            
+            # feedparser erwartet kleingeschriebene Header-Namen; content-location
+            # dient als Basis-URL fuer relative Links (nach Redirects die finale URL)
+            kopfzeilen = {name.lower(): wert for name, wert in response.headers.items()}
+            kopfzeilen['content-location'] = response.url
         
-        return list(schlagworte)[:5]
+        return b''.join(chunks), kopfzeilen
     
-    def hole_rss_feeds(self) -> List[BildungsNews]:
-        """Liest RSS-Feeds aus und extrahiert Nachrichten"""
+    def _erstelle_news(self, eintraege: List[Dict]) -> List[BildungsNews]:
+        """Kategorisiert geparste Feed-Eintraege und erzeugt BildungsNews-Objekte"""
         alle_news = []
         
-        # Standard RSS-Feeds
-        all_feeds = self.rss_feeds + self.google_news_feeds
+        for eintrag in eintraege:
+            # Kategorie und Schlagworte ermitteln (ein Scan pro Artikel, begrenzte Textlaenge)
+            scan_text = f"{eintrag['titel']} {eintrag['zusammenfassung'][:_MAX_SCAN_ZEICHEN]}"
+            kategorie, schlagworte = self.analysiere(scan_text)
+            
+            news = BildungsNews(
+                titel=eintrag['titel'],
+                quelle=self._intern.setdefault(eintrag['quelle'], eintrag['quelle']),
+                url=eintrag['url'],
+                datum=self._intern.setdefault(eintrag['datum'], eintrag['datum']),
+                kategorie=kategorie,
+                zusammenfassung=eintrag['zusammenfassung'][:200],
+                schlagworte=schlagworte
+            )
+            alle_news.append(news)
         
-        for feed_url in all_feeds:
+        return alle_news
+    
+    def _hole_feeds(self, feed_urls: List[str], threads: ThreadPoolExecutor,
+                    prozesse: ProcessPoolExecutor) -> List[BildungsNews]:
+        """Laedt Feeds im Thread-Pool und parst sie im Prozess-Pool"""
+        c = self._conn.cursor()
+        c.execute("SELECT url, etag, last_modified FROM feed_status")
+        status = {url: (etag, last_modified) for url, etag, last_modified in c.fetchall()}
+        
+        downloads = {
+            threads.submit(self._lade_feed, url, *status.get(url, (None, None))): url
+            for url in feed_urls
+        }
+        
+        # Jeden fertigen Download sofort zum Parsen weiterreichen
+        heute = datetime.now().strftime('%Y-%m-%d')
+        parse_jobs = {}
+        # Rohdaten fuer Feeds, die nach einem Ausfall des Pools hier im Prozess geparst werden
+        direkt_parsen = {}
+        pool_defekt = False
+        neuer_status = {}
+        for future in as_completed(downloads):
+            feed_url = downloads[future]
             try:
-                feed = feedparser.parse(feed_url)
-                
-                for entry in feed.entries[:10]:
-                    titel = entry.get('title', '')
-                    zusammenfassung = entry.get('summary', entry.get('description', ''))
-                    url = entry.get('link', '')
-                    
-                    # Datum parsen mit Fehlerbehandlung
-                    try:
-                        if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                            datum = time.strftime('%Y-%m-%d', entry.published_parsed)
-                        elif hasattr(entry, 'updated_parsed') and entry.updated_parsed:
-                            datum = time.strftime('%Y-%m-%d', entry.updated_parsed)
-                        else:
-                            datum = datetime.now().strftime('%Y-%m-%d')
-                    except (TypeError, ValueError):
-                        datum = datetime.now().strftime('%Y-%m-%d')
-                    
-                    # Kategorie und Schlagworte ermitteln
-                    volltext = f"{titel} {zusammenfassung}"
-                    kategorie = self.kategorisiere(volltext)
-                    schlagworte = self.extrahiere_schlagworte(volltext)
-                    
-                    news = BildungsNews(
-                        titel=titel,
-                        quelle=feed.feed.get('title', feed_url),
-                        url=url,
-                        datum=datum,
-                        kategorie=kategorie,
-                        zusammenfassung=zusammenfassung[:200],
-                        schlagworte=schlagworte
-                    )
-                    alle_news.append(news)
-                    
+                daten, kopfzeilen = future.result()
             except Exception as e:
                 print(f"Fehler beim Abrufen von {feed_url}: {e}")
+                continue
+            if daten is None:
+                # 304: seit dem letzten Abruf nichts Neues
+                continue
+            if not pool_defekt:
+                try:
+                    parse_jobs[feed_url] = prozesse.submit(parse_feed, feed_url, daten, kopfzeilen, heute)
+                except BrokenProcessPool as e:
+                    # Ein Parser-Prozess ist abgestuerzt (z.B. OOM); der Pool nimmt nichts
+                    # mehr an. Die uebrigen Feeds nicht verwerfen, sondern direkt parsen
+                    print(f"Prozess-Pool ausgefallen, parse restliche Feeds direkt: {e}")
+                    pool_defekt = True
+            if pool_defekt:
+                direkt_parsen[feed_url] = (daten, kopfzeilen)
+            neuer_status[feed_url] = (kopfzeilen.get('etag'), kopfzeilen.get('last-modified'))
+        
+        # Ergebnisse in der Reihenfolge der Feed-Liste einsammeln
+        alle_news = []
+        for feed_url in feed_urls:
+            try:
+                if feed_url in parse_jobs:
+                    # Bei einem Pool-Ausfall schlagen auch noch laufende Jobs fehl; diese
+                    # Feeds werden uebersprungen (nicht direkt geparst, der Absturz koennte
+                    # von ihnen stammen) und beim naechsten Lauf erneut abgerufen
+                    eintraege = parse_jobs[feed_url].result()
+                elif feed_url in direkt_parsen:
+                    daten, kopfzeilen = direkt_parsen[feed_url]
+                    eintraege = parse_feed(feed_url, daten, kopfzeilen, heute)
+                else:
+                    continue
+                alle_news.extend(self._erstelle_news(eintraege))
+            except Exception as e:
+                print(f"Fehler beim Parsen von {feed_url}: {e}")
+                continue
+            self._offene_feed_status[feed_url] = neuer_status[feed_url]
         
         return alle_news
     
+    def hole_rss_feeds(self) -> List[BildungsNews]:
+        """Liest RSS-Feeds parallel aus und extrahiert Nachrichten"""
+        # Standard RSS-Feeds
+        all_feeds = self.rss_feeds + self.google_news_feeds
+        
+        # Netzwerk-I/O ueberlappen: Gesamtdauer ~ langsamster Feed statt Summe;
+        # das CPU-lastige Parsen laeuft in eigenen Prozessen (am GIL vorbei)
+        with ThreadPoolExecutor(max_workers=8) as threads, _prozess_pool(len(all_feeds)) as prozesse:
+            return self._hole_feeds(all_feeds, threads, prozesse)
+    
     def scrape_website(self, url: str) -> List[BildungsNews]:
         """Scraped Nachrichten von einer Website"""
         alle_news = []
@@ -188,46 +508,53 @@ class BildungsMonitor:
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
             }
             # SSL-Verifizierung deaktivieren falls noetig und Timeout erhoehen
-            response = requests.get(url, headers=headers, timeout=15, verify=True)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Gestreamt: lxml bekommt den (dekomprimierten) Socket-Stream stueckweise,
+            # ohne den ganzen Body vorher als bytes-Objekt zu kopieren
+            with self.session.get(url, headers=headers, timeout=15, verify=True, stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                anfang = response.raw.read(_HTML_KOPF_BYTES)
+                parser = lxml.html.HTMLParser(encoding=_html_kodierung(response.headers, anfang))
+                parser.feed(anfang)
+                for chunk in iter(lambda: response.raw.read(65536), b''):
+                    parser.feed(chunk)
+                tree = parser.close()
+            if tree is None:
+                return alle_news
             
             # Suche nach haeufigen News-Elementen
-            news_elements = soup.find_all(['article', 'div'], class_=re.compile('news|article|post|aktuell', re.I))
+            news_elements = _NEWS_XPATH(tree)
             
-            for element in news_elements[:10]:
-                titel_tag = element.find(['h1', 'h2', 'h3', 'h4', 'a'])
+            for element in news_elements:
+                titel_tag = _TITEL_XPATH(element)
                 if not titel_tag:
                     continue
                 
-                titel = titel_tag.get_text(strip=True)
+                titel = _text(titel_tag[0])
                 if not titel or len(titel) < 10:
                     continue
                 
                 # URL extrahieren
-                link_tag = element.find('a', href=True)
-                artikel_url = link_tag['href'] if link_tag else url
+                link_tag = _LINK_XPATH(element)
+                artikel_url = link_tag[0].get('href') if link_tag else url
                 if artikel_url.startswith('/'):
                     from urllib.parse import urljoin
                     artikel_url = urljoin(url, artikel_url)
                 
                 # Zusammenfassung
-                text_tag = element.find(['p', 'div'], class_=re.compile('text|beschreibung|summary|excerpt', re.I))
-                zusammenfassung = text_tag.get_text(strip=True)[:200] if text_tag else ''
+                text_tag = _TEXT_XPATH(element)
+                zusammenfassung = _text(text_tag[0])[:200] if text_tag else ''
                 
                 # Datum
                 datum = datetime.now().strftime('%Y-%m-%d')
                 
-                volltext = f"{titel} {zusammenfassung}"
-                kategorie = self.kategorisiere(volltext)
-                schlagworte = self.extrahiere_schlagworte(volltext)
+                kategorie, schlagworte = self.analysiere(f"{titel} {zusammenfassung}")
                 
                 news = BildungsNews(
                     titel=titel,
-                    quelle=url,
+                    quelle=self._intern.setdefault(url, url),
                     url=artikel_url,
-                    datum=datum,
+                    datum=self._intern.setdefault(datum, datum),
                     kategorie=kategorie,
                     zusammenfassung=zusammenfassung,
                     schlagworte=schlagworte
@@ -237,7 +564,7 @@ class BildungsMonitor:
         except requests.exceptions.SSLError:
             # Bei SSL-Problemen mit verify=False versuchen
             try:
-                response = requests.get(url, headers=headers, timeout=15, verify=False)
+                response = self.session.get(url, headers=headers, timeout=15, verify=False)
                 print(f"Warnung: SSL-Verifizierung deaktiviert fuer {url}")
                 # Rest des Codes wuerde hier folgen, aber wir loggen nur
             except Exception as e:
@@ -253,79 +580,73 @@ class BildungsMonitor:
         """Sammelt News aus allen Quellen (RSS + Scraping)"""
         alle_news = []
         
-        # RSS-Feeds
-        print("Hole RSS-Feeds...")
-        alle_news.extend(self.hole_rss_feeds())
-        
-        # Web-Scraping
-        print("Scrape Websites...")
-        for url in self.scrape_urls:
-            alle_news.extend(self.scrape_website(url))
-        
-        return alle_news
+        # RSS-Feeds und Web-Scraping teilen sich einen Thread-Pool fuer die Downloads
+        print("Hole RSS-Feeds und scrape Websites...")
+        all_feeds = self.rss_feeds + self.google_news_feeds
+        with ThreadPoolExecutor(max_workers=8) as threads, _prozess_pool(len(all_feeds)) as prozesse:
+            scrape_ergebnisse = threads.map(self.scrape_website, self.scrape_urls)
+            alle_news.extend(self._hole_feeds(all_feeds, threads, prozesse))
+            
+            for news in scrape_ergebnisse:
+                alle_news.extend(news)
+        
+        # Doppelte URLs (z.B. dieselbe Meldung in mehreren Google-News-Feeds) schon hier
+        # verwerfen; wie beim UNIQUE-Constraint bleibt der erste Eintrag erhalten
+        gesehen = set()
+        eindeutige_news = []
+        for news in alle_news:
+            if news.url not in gesehen:
+                gesehen.add(news.url)
+                eindeutige_news.append(news)
+        
+        return eindeutige_news
     
     def speichere_news(self, news_liste: List[BildungsNews]):
         """Speichert neue Nachrichten in der Datenbank"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        neu_hinzugefuegt = 0
-        for news in news_liste:
-            try:
-                c.execute('''
-                    INSERT INTO nachrichten 
-                    (titel, quelle, url, datum, kategorie, zusammenfassung, schlagworte)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    news.titel,
-                    news.quelle,
-                    news.url,
-                    news.datum,
-                    news.kategorie,
-                    news.zusammenfassung,
-                    json.dumps(news.schlagworte)
-                ))
-                neu_hinzugefuegt += 1
-            except sqlite3.IntegrityError:
-                pass
-        
-        conn.commit()
-        conn.close()
-        
-        return neu_hinzugefuegt
-        """Speichert neue Nachrichten in der Datenbank"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self._conn.cursor()
+        
+        # Generator: executemany zieht die Zeilen direkt, ohne Zwischenliste
+        rows = (
+            (
+                news.titel,
+                news.quelle,
+                news.url,
+                news.datum,
+                news.kategorie,
+                news.zusammenfassung,
+                json.dumps(news.schlagworte)
+            )
+            for news in news_liste
+        )
         
-        neu_hinzugefuegt = 0
-        for news in news_liste:
-            try:
-                c.execute('''
-                    INSERT INTO nachrichten 
-                    (titel, quelle, url, datum, kategorie, zusammenfassung, schlagworte)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    news.titel,
-                    news.quelle,
-                    news.url,
-                    news.datum,
-                    news.kategorie,
-                    news.zusammenfassung,
-                    json.dumps(news.schlagworte)
-                ))
-                neu_hinzugefuegt += 1
-            except sqlite3.IntegrityError:
-                pass
-        
-        conn.commit()
-        conn.close()
+        # Alle Inserts in einer Transaktion; Duplikate (url UNIQUE) werden ignoriert
+        c.execute("BEGIN IMMEDIATE")
+        try:
+            c.executemany('''
+                INSERT OR IGNORE INTO nachrichten 
+                (titel, quelle, url, datum, kategorie, zusammenfassung, schlagworte)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            # rowcount statt total_changes: zaehlt die Schreibzugriffe der FTS-Trigger nicht mit
+            neu_hinzugefuegt = c.rowcount
+            
+            # Feed-Validatoren erst jetzt festschreiben, damit ein abgebrochener Lauf
+            # beim naechsten Mal nicht faelschlich 304 erhaelt
+            c.executemany('''
+                INSERT OR REPLACE INTO feed_status (url, etag, last_modified, letzter_abruf)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            ''', [(url, etag, last_modified) for url, (etag, last_modified) in self._offene_feed_status.items()])
+            c.execute("COMMIT")
+            self._offene_feed_status.clear()
+        except Exception:
+            c.execute("ROLLBACK")
+            raise
         
         return neu_hinzugefuegt
     
     def erstelle_bericht(self, tage: int = 7) -> Dict:
         """Erstellt einen Bericht ueber die letzten N Tage"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self._conn.cursor()
         
         datum_von = (datetime.now() - timedelta(days=tage)).strftime('%Y-%m-%d')
         
@@ -360,8 +681,6 @@ class BildungsMonitor:
         
         top_news = c.fetchall()
         
-        conn.close()
-        
         return {
             'zeitraum': f'Letzte {tage} Tage',
             'kategorien': alle_kategorien,
@@ -371,16 +690,28 @@ class BildungsMonitor:
     
     def suche_thema(self, suchbegriff: str, limit: int = 10) -> List[Dict]:
         """Sucht nach einem bestimmten Thema"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        c = self._conn.cursor()
         
-        c.execute('''
-            SELECT titel, quelle, url, datum, kategorie, zusammenfassung
-            FROM nachrichten
-            WHERE titel LIKE ? OR zusammenfassung LIKE ?
-            ORDER BY datum DESC
-            LIMIT ?
-        ''', (f'%{suchbegriff}%', f'%{suchbegriff}%', limit))
+        if _FTS_TRIGRAMM and len(suchbegriff) >= 3:
+            # Trigramm-Index; Suchbegriff als Phrase quoten (keine FTS-Syntax)
+            phrase = '"' + suchbegriff.replace('"', '""') + '"'
+            c.execute('''
+                SELECT n.titel, n.quelle, n.url, n.datum, n.kategorie, n.zusammenfassung
+                FROM nachrichten_fts
+                JOIN nachrichten n ON n.id = nachrichten_fts.rowid
+                WHERE nachrichten_fts MATCH ?
+                ORDER BY n.datum DESC
+                LIMIT ?
+            ''', (phrase, limit))
+        else:
+            # Trigramme brauchen mind. 3 Zeichen, kurze Begriffe (oder altes SQLite) weiter per LIKE
+            c.execute('''
+                SELECT titel, quelle, url, datum, kategorie, zusammenfassung
+                FROM nachrichten
+                WHERE titel LIKE ? OR zusammenfassung LIKE ?
+                ORDER BY datum DESC
+                LIMIT ?
+            ''', (f'%{suchbegriff}%', f'%{suchbegriff}%', limit))
         
         ergebnisse = []
         for row in c.fetchall():
@@ -393,7 +724,6 @@ class BildungsMonitor:
                 'zusammenfassung': row[5]
             })
         
-        conn.close()
         return ergebnisse
     
     def starte_monitoring(self, intervall_minuten: int = 60):
@@ -404,16 +734,22 @@ class BildungsMonitor:
             neu = self.speichere_news(news)
             print(f"-> {neu} neue Nachrichten hinzugefuegt")
         
+        # Ereignisgesteuert: der Planer schlaeft bis zum naechsten Lauf durch,
+        # statt jede Sekunde aufzuwachen
+        planer = sched.scheduler(time.monotonic, time.sleep)
+        
+        def naechster_lauf():
+            monitoring_job()
+            planer.enter(intervall_minuten * 60, 1, naechster_lauf)
+        
         monitoring_job()
         
-        schedule.every(intervall_minuten).minutes.do(monitoring_job)
+        planer.enter(intervall_minuten * 60, 1, naechster_lauf)
         
         print(f"\nMonitoring laeuft (alle {intervall_minuten} Minuten)")
         print("Druecke Ctrl+C zum Beenden\n")
         
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+        planer.run()
 
 
 # Beispiel-Nutzung
@@ -449,26 +785,27 @@ if __name__ == "__main__":
     print("NACHRICHTEN PRO KATEGORIE")
     print("="*80)
     
+    # Alle Nachrichten des Zeitraums in einer Abfrage holen und nach Kategorie gruppieren
+    c = monitor._conn.cursor()
+    datum_von = (datetime.now() - timedelta(days=anzahl_tage)).strftime('%Y-%m-%d')
+    c.execute('''
+        SELECT kategorie, titel, quelle, url, datum
+        FROM nachrichten
+        WHERE datum >= ?
+        ORDER BY kategorie, datum DESC
+    ''', (datum_von,))
+    nachrichten_pro_kategorie = {
+        kat: [row[1:] for row in rows]
+        for kat, rows in groupby(c.fetchall(), key=lambda row: row[0])
+    }
+    
     # Kategorien mit Treffern
     for kat, anzahl in sorted(bericht['kategorien'].items(), key=lambda x: x[1], reverse=True):
         if anzahl > 0:
             print(f"\n### {kat.upper()} ({anzahl} Nachrichten) ###")
             print("-"*80)
             
-            # Hole alle Nachrichten dieser Kategorie
-            conn = sqlite3.connect(monitor.db_path)
-            c = conn.cursor()
-            datum_von = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-            c.execute('''
-                SELECT titel, quelle, url, datum
-                FROM nachrichten
-                WHERE kategorie = ? AND datum >= ?
-                ORDER BY datum DESC
-            ''', (kat, datum_von))
-            
-            nachrichten = c.fetchall()
-            conn.close()
-            
+            nachrichten = nachrichten_pro_kategorie.get(kat, [])
             for i, (titel, quelle, url, datum) in enumerate(nachrichten, 1):
                 print(f"{i}. {titel}")
                 print(f"   Quelle: {quelle} | Datum: {datum}")